@@ -47,7 +47,9 @@
 #        • Auth: X-Relay-Token header (from FREEPBX_RELAY_TOKEN in .env)
 #        • POST /call {"to": "+1...", "message": "alert text"}
 #        • flite TTS → sox 8kHz PCM → Asterisk call file in spool
-#        • systemd: akira-ami-relay.service (enabled, survives reboots)
+#        • PRECACHE_MESSAGES (optional, in .env) rendered at relay startup
+#        • systemd: akira-ami-relay.service (enabled, survives reboots),
+#          runs as the asterisk user so its files need no chown
 #
 # ─── CONTAINER DELTA (auto-preserved on every image update) ───────────────────
 #
@@ -208,6 +210,7 @@ setup_freepbx_relay() {
     ssh "$FREEPBX_VM" "sudo tee /etc/freepbx-relay.env > /dev/null" << RELAYENV
 FREEPBX_RELAY_TOKEN=${FREEPBX_RELAY_TOKEN}
 RELAY_PORT=18511
+PRECACHE_MESSAGES=${PRECACHE_MESSAGES:-}
 RELAYENV
     ssh "$FREEPBX_VM" "sudo chmod 600 /etc/freepbx-relay.env"
 
@@ -218,6 +221,9 @@ Description=OpenClaw Phone Call Relay (FreePBX)
 After=network.target asterisk.service
 [Service]
 Type=simple
+User=asterisk
+Group=asterisk
+UMask=0027
 EnvironmentFile=/etc/freepbx-relay.env
 ExecStart=/usr/bin/python3 /usr/local/bin/freepbx-ami-relay.py
 Restart=always
@@ -9,24 +9,52 @@ the relay runs locally and writes spool files that Asterisk picks up directly.
 Endpoints:
   POST /call
     Headers: X-Relay-Token: <FREEPBX_RELAY_TOKEN>
+             Idempotency-Key: <any string> (optional; defaults to to + message,
+             repeats within 60s return the first result without calling again)
     Body:    {"to": "+E164_PHONE_NUMBER", "message": "Alert: service down"}
-    Returns: {"status": "ok", "to": "+E164...", "sound": "akira-alert-NNNN"}
+    Returns: {"status": "ok", "to": "+E164...", "sound": "akira-alert-<hash>"}
+
+  POST /call_batch
+    Headers: same as /call
+    Body:    {"to": "+E164_PHONE_NUMBER", "messages": ["NAS down", "Backup failed"]}
+    Returns: same as /call — one call that speaks all messages in order
 
   GET /health
     Returns: {"status": "ok"}
 
 Setup:
   Installed by deploy.sh (--setup-freepbx) to /usr/local/bin/freepbx-ami-relay.py
-  Run as systemd service: openclaw-ami-relay.service
-  Env: FREEPBX_RELAY_TOKEN (required), RELAY_PORT (default 18511)
+  Run as systemd service: openclaw-ami-relay.service (User=asterisk, so the
+  WAVs and call files it writes are already owned by Asterisk)
+  Env: FREEPBX_RELAY_TOKEN (required), RELAY_PORT (default 18511),
+       PRECACHE_MESSAGES (optional, "|"-separated alert texts rendered at startup)
 
 Requirements on the FreePBX VM:
   apt install flite sox
-  (both are used by generate_tts to produce 8kHz PCM WAV for Asterisk Playback)
+  (both are used by generate_tts to produce 8kHz PCM WAV for Asterisk Playback;
+  libflite is loaded in-process when present, otherwise the flite binary is run,
+  and resampling is done with the stdlib audioop module when available — sox is
+  only needed on Python 3.13+, where audioop was removed)
 """
 
-from http.server import HTTPServer, BaseHTTPRequestHandler
-import json, os, time, subprocess, shutil, sys
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import collections, contextlib, ctypes, ctypes.util, hashlib, hmac, io, itertools, json, os, time, subprocess, sys, tempfile, threading, wave, warnings
+
+with warnings.catch_warnings():
+    # audioop is deprecated (removed in Python 3.13); without it we fall back to sox.
+    warnings.simplefilter("ignore", DeprecationWarning)
+    try:
+        import audioop
+    except ImportError:
+        audioop = None
+
+try:
+    # Resolved once: getpwnam/getgrnam can hit NSS (LDAP/SSSD) on every call.
+    import grp, pwd
+    _AST_UID = pwd.getpwnam("asterisk").pw_uid
+    _AST_GID = grp.getgrnam("asterisk").gr_gid
+except (ImportError, KeyError):
+    _AST_UID = _AST_GID = None
 
 RELAY_TOKEN = os.environ.get("FREEPBX_RELAY_TOKEN", "")
 RELAY_PORT  = int(os.environ.get("RELAY_PORT", "18511"))
@@ -35,68 +63,321 @@ SOUNDS_DIR  = "/var/lib/asterisk/sounds/custom"
 TRUNK       = os.environ.get("ASTERISK_TRUNK", "YOUR_TRUNK_NAME")  # e.g. "Twilio" or "VoIP.ms"
 CALLER_ID   = os.environ.get("CALLER_ID", "Akira <+E164_CALLER_NUMBER>")
 MAX_SOUND_AGE_SECS = 3600  # clean up TTS files older than 1 hour
+CLEANUP_INTERVAL_SECS = 300  # how often the background sweeper runs
+MAX_BODY_BYTES = 8192  # far above any alert payload; larger bodies get a 413
+IDEMPOTENCY_WINDOW_SECS = 60    # repeat /calls within this window return the first result
+IDEMPOTENCY_MAX_KEYS    = 1024  # LRU cap on remembered calls
+PRECACHE_MESSAGES = [m.strip() for m in os.environ.get("PRECACHE_MESSAGES", "").split("|") if m.strip()]
+
+# Requests are served on their own threads, so two calls can land in the same
+# millisecond — the sequence number keeps their call-file names distinct.
+_call_seq = itertools.count()
+
+# Asterisk call file body. TRUNK and CALLER_ID are fixed for the process, so
+# they're baked in here (braces escaped) and only {to}/{sound_name} vary.
+_CALL_TPL = (
+    f"Channel: PJSIP/{{to}}@{TRUNK.replace('{', '{{').replace('}', '}}')}\n"
+    f"Application: Playback\n"
+    f"Data: custom/{{sound_name}}\n"
+    f"MaxRetries: 2\n"
+    f"RetryTime: 30\n"
+    f"WaitTime: 45\n"
+    f"CallerID: {CALLER_ID.replace('{', '{{').replace('}', '}}')}\n"
+)
+
+# /health is polled constantly — its whole response is built once here.
+_HEALTH_BODY     = b'{"status": "ok"}'
+_HEALTH_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: " + str(len(_HEALTH_BODY)).encode() + b"\r\n"
+    b"\r\n" + _HEALTH_BODY
+)
+
+
+class _CstWave(ctypes.Structure):
+    """Layout of flite's cst_wave (cst_wave.h)."""
+    _fields_ = [
+        ("type",         ctypes.c_char_p),
+        ("sample_rate",  ctypes.c_int),
+        ("num_samples",  ctypes.c_int),
+        ("num_channels", ctypes.c_int),
+        ("samples",      ctypes.POINTER(ctypes.c_short)),
+    ]
+
+
+def _load_flite():
+    """Load libflite and the default (kal) voice once, in-process.
+    Returns (lib, voice), or None if the shared libraries aren't installed —
+    generate_tts then falls back to spawning the flite binary."""
+    try:
+        lib = ctypes.CDLL(ctypes.util.find_library("flite") or "libflite.so.1")
+        kal = ctypes.CDLL(ctypes.util.find_library("flite_cmu_us_kal") or "libflite_cmu_us_kal.so.1")
+    except OSError:
+        return None
 
+    lib.flite_init()
+    kal.register_cmu_us_kal.argtypes = [ctypes.c_char_p]
+    kal.register_cmu_us_kal.restype  = ctypes.c_void_p
+    lib.flite_text_to_wave.argtypes  = [ctypes.c_char_p, ctypes.c_void_p]
+    lib.flite_text_to_wave.restype   = ctypes.POINTER(_CstWave)
+    lib.delete_wave.argtypes         = [ctypes.POINTER(_CstWave)]
+    lib.delete_wave.restype          = None
 
-def generate_tts(message: str, uid: str) -> str:
-    """Generate a WAV file from text using flite + sox for Asterisk compatibility.
-    Returns the sound name (without .wav) for Asterisk Playback."""
-    sound_name = f"akira-alert-{uid}"
-    raw_path   = os.path.join(SOUNDS_DIR, f"{sound_name}-raw.wav")
-    final_path = os.path.join(SOUNDS_DIR, f"{sound_name}.wav")
+    voice = kal.register_cmu_us_kal(None)
+    if not voice:
+        return None
+    return lib, voice
+
+
+_FLITE      = _load_flite()
+_flite_lock = threading.Lock()  # flite isn't documented as thread-safe
 
-    os.makedirs(SOUNDS_DIR, exist_ok=True)
+_key_locks       = {}  # key -> [lock, holders + waiters]; see _keyed_lock
+_key_locks_guard = threading.Lock()
 
-    # Generate TTS with flite (any sample rate)
-    subprocess.run(["flite", "-t", message, "-o", raw_path], check=True, capture_output=True)
+_recent_calls = collections.OrderedDict()  # idempotency key -> (monotonic time, result)
+_recent_lock  = threading.Lock()
 
-    # Convert to Asterisk-expected format: 8kHz, mono, signed 16-bit PCM
-    subprocess.run(
-        ["sox", raw_path, "-r", "8000", "-c", "1", "-e", "signed-integer", "-b", "16", final_path],
-        check=True, capture_output=True
+_pinned_sounds = set()  # precached sound names, exempt from cleanup
+
+_spool_fd      = None  # see _spool_dir_fd
+_spool_fd_lock = threading.Lock()
+
+
+def _flite_synth(message: str) -> tuple:
+    """Synthesize `message` with the warm in-process flite voice.
+    Returns (pcm, sample_rate, channels) with native-endian s16 samples."""
+    lib, voice = _FLITE
+    with _flite_lock:
+        w_ptr = lib.flite_text_to_wave(message.encode("utf-8"), voice)
+        if not w_ptr:
+            raise RuntimeError("flite_text_to_wave failed")
+        try:
+            w   = w_ptr.contents
+            pcm = ctypes.string_at(w.samples, w.num_samples * w.num_channels * 2)
+            return pcm, w.sample_rate, w.num_channels
+        finally:
+            lib.delete_wave(w_ptr)
+
+
+def _flite_cli_synth(message: str) -> tuple:
+    """Synthesize `message` with the flite binary, reading its WAV from stdout.
+    Returns (pcm, sample_rate, channels, sample_width)."""
+    proc = subprocess.run(
+        ["flite", "-t", message, "-o", "/dev/stdout"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
     )
-    os.remove(raw_path)
+    with wave.open(io.BytesIO(proc.stdout)) as w:
+        return w.readframes(w.getnframes()), w.getframerate(), w.getnchannels(), w.getsampwidth()
+
+
+def _write_asterisk_wav(pcm: bytes, rate: int, channels: int, width: int, out_path: str):
+    """Convert PCM to 8kHz, mono, signed 16-bit in-process with audioop and
+    write it as a WAV — the job sox would otherwise be spawned for."""
+    if width != 2:
+        pcm = audioop.lin2lin(pcm, width, 2)
+    if channels == 2:
+        pcm = audioop.tomono(pcm, 2, 0.5, 0.5)
+    if rate != 8000:
+        pcm, _ = audioop.ratecv(pcm, 2, 1, rate, 8000, None)
+    with wave.open(out_path, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(8000)
+        w.writeframes(pcm)
+
+
+def _render_wav(message: str, out_path: str):
+    """Write `message` as an 8kHz, mono, signed 16-bit PCM WAV to `out_path`."""
+    if audioop is not None:
+        # Resample in-process: no sox fork/exec and no intermediate file.
+        if _FLITE is not None:
+            pcm, rate, channels = _flite_synth(message)
+            _write_asterisk_wav(pcm, rate, channels, 2, out_path)
+        else:
+            _write_asterisk_wav(*_flite_cli_synth(message), out_path)
+        return
+
+    if _FLITE is not None:
+        # Warm engine: no flite fork/exec, raw PCM is fed to sox on stdin.
+        pcm, rate, channels = _flite_synth(message)
+        subprocess.run(
+            ["sox", "-t", "raw", "-r", str(rate), "-c", str(channels), "-e", "signed-integer",
+             "-b", "16", "-", "-r", "8000", "-c", "1", "-e", "signed-integer", "-b", "16",
+             "-t", "wav", out_path],
+            input=pcm, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True
+        )
+        return
+
+    # flite | sox in one pipeline: flite streams its WAV to stdout and sox
+    # converts it without an intermediate file. flite's stderr goes to a temp
+    # file rather than a pipe: nothing drains it while sox runs, so a pipe
+    # could fill up and stall the pipeline.
+    with tempfile.TemporaryFile() as flite_err:
+        flite = subprocess.Popen(
+            ["flite", "-t", message, "-o", "/dev/stdout"],
+            stdout=subprocess.PIPE, stderr=flite_err
+        )
+        sox = subprocess.Popen(
+            ["sox", "-t", "wav", "-", "-r", "8000", "-c", "1", "-e", "signed-integer", "-b", "16",
+             "-t", "wav", out_path],
+            stdin=flite.stdout, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+        flite.stdout.close()  # sox holds the only read end; flite gets SIGPIPE if sox exits
+        _, sox_err = sox.communicate()
+        flite.wait()
+        # sox first: if it dies, flite fails writing into the closed pipe
+        # (SIGPIPE, empty stderr) and only sox's stderr says what went wrong.
+        if sox.returncode != 0:
+            raise subprocess.CalledProcessError(sox.returncode, sox.args, stderr=sox_err)
+        if flite.returncode != 0:
+            flite_err.seek(0)
+            raise subprocess.CalledProcessError(flite.returncode, flite.args, stderr=flite_err.read())
+
+
+def _chown_asterisk(path):
+    """Give a new file (path or open fd) to the asterisk user. Only needed when
+    the relay is started as root; under the stock unit (User=asterisk) files
+    are already owned correctly and this is a no-op."""
+    if _AST_UID is not None and os.geteuid() == 0:
+        os.chown(path, _AST_UID, _AST_GID)
+
+
+@contextlib.contextmanager
+def _keyed_lock(key: str):
+    """Hold the lock for `key`. Entries are reference-counted and dropped once
+    the last holder/waiter leaves, so the table stays small."""
+    with _key_locks_guard:
+        entry = _key_locks.setdefault(key, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _key_locks_guard:
+            entry[1] -= 1
+            if not entry[1]:
+                del _key_locks[key]
+
+
+def generate_tts(message: str) -> str:
+    """Generate a WAV file from text using flite (libflite in-process when
+    available, else the flite binary), resampled with audioop (or sox) for
+    Asterisk compatibility.
+    Returns the sound name (without .wav) for Asterisk Playback.
+
+    Files are keyed on a hash of the message, so a repeated alert reuses the
+    WAV already on disk instead of re-running flite + sox."""
+    key        = hashlib.blake2b(message.encode("utf-8"), digest_size=8).hexdigest()
+    sound_name = f"akira-alert-{key}"
+    final_path = os.path.join(SOUNDS_DIR, f"{sound_name}.wav")
 
-    # Ensure asterisk process can read it
+    # Cache hit — bump mtime so _cleanup_old_sounds keeps hot entries. utime is
+    # the existence check itself, so a WAV the sweeper just removed is re-rendered.
     try:
-        shutil.chown(final_path, "asterisk", "asterisk")
-    except Exception:
+        os.utime(final_path)
+        return sound_name
+    except FileNotFoundError:
         pass
 
+    # Single-flight: concurrent requests for the same message wait for the
+    # first one to render, then reuse its WAV.
+    with _keyed_lock(f"tts:{key}"):
+        try:
+            os.utime(final_path)
+            return sound_name
+        except FileNotFoundError:
+            pass
+
+        # pid + thread id: unique even if the per-key lock is bypassed (e.g.
+        # two relay processes sharing SOUNDS_DIR), so renders never share a tmp.
+        tmp_path = f"{final_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        os.makedirs(SOUNDS_DIR, exist_ok=True)
+
+        # Written to a tmp file and renamed so Asterisk never plays a half-written WAV.
+        try:
+            _render_wav(message, tmp_path)
+        except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            if isinstance(e, subprocess.CalledProcessError) and e.stderr:
+                print(f"[ami-relay] {e.cmd[0]} failed: {e.stderr.decode(errors='replace').strip()}",
+                      file=sys.stderr, flush=True)
+            raise
+
+        _chown_asterisk(tmp_path)
+        os.replace(tmp_path, final_path)
+
     return sound_name
 
 
-def originate_call(to: str, message: str) -> dict:
-    """Write an Asterisk call file to trigger an outbound call."""
-    uid = str(int(time.time() * 1000))
+def _spool_dir_fd() -> int:
+    """Return a directory fd for SPOOL_DIR, opened on first use and kept for
+    the life of the process. Call files are created, renamed and fsync'd
+    relative to it, so the spool path isn't re-resolved on every call."""
+    global _spool_fd
+    with _spool_fd_lock:
+        if _spool_fd is None:
+            _spool_fd = os.open(SPOOL_DIR, os.O_RDONLY | os.O_DIRECTORY)
+        return _spool_fd
 
-    sound_name = generate_tts(message, uid)
 
-    # Asterisk call file — atomic write (tmp → final) so Asterisk doesn't
-    # pick up a partial file.
-    call_file = os.path.join(SPOOL_DIR, f"akira-{uid}.call")
-    tmp_file  = call_file + ".tmp"
-
-    content = (
-        f"Channel: PJSIP/{to}@{TRUNK}\n"
-        f"Application: Playback\n"
-        f"Data: custom/{sound_name}\n"
-        f"MaxRetries: 2\n"
-        f"RetryTime: 30\n"
-        f"WaitTime: 45\n"
-        f"CallerID: {CALLER_ID}\n"
-    )
-    with open(tmp_file, "w") as f:
-        f.write(content)
+def originate_call(to: str, message: str, idempotency_key: str = "") -> dict:
+    """Write an Asterisk call file to trigger an outbound call.
 
-    try:
-        shutil.chown(tmp_file, "asterisk", "asterisk")
-    except Exception:
-        pass
+    Requests with the same idempotency key (default: hash of to + message)
+    within IDEMPOTENCY_WINDOW_SECS get the first call's result back instead
+    of placing another call — monitoring retries don't ring the phone twice."""
+    key = idempotency_key or hashlib.blake2b(f"{to}|{message}".encode("utf-8"), digest_size=8).hexdigest()
+
+    with _keyed_lock(f"call:{key}"):
+        with _recent_lock:
+            hit = _recent_calls.get(key)
+            if hit and time.monotonic() - hit[0] < IDEMPOTENCY_WINDOW_SECS:
+                return hit[1]
+
+        result = _originate_call(to, message)
+
+        with _recent_lock:
+            _recent_calls[key] = (time.monotonic(), result)
+            _recent_calls.move_to_end(key)
+            while len(_recent_calls) > IDEMPOTENCY_MAX_KEYS:
+                _recent_calls.popitem(last=False)
 
-    os.rename(tmp_file, call_file)
+    return result
 
-    # Async cleanup of old TTS files
-    _cleanup_old_sounds()
+
+def _originate_call(to: str, message: str) -> dict:
+    """Render the TTS and write the call file — originate_call minus dedup."""
+    uid = f"{int(time.time() * 1000)}-{next(_call_seq)}"
+
+    sound_name = generate_tts(message)
+
+    # Asterisk call file — atomic write (tmp → final) so Asterisk doesn't
+    # pick up a partial file. The tmp file is fsync'd before the rename and the
+    # spool dir after it, so a crash can't leave Asterisk an empty call file.
+    # (O_TMPFILE + linkat would save the tmp name, but Asterisk's spool watcher
+    # expects a rename into the directory, not a bare link appearing.)
+    call_name = f"akira-{uid}.call"
+    tmp_name  = call_name + ".tmp"
+    call_file = os.path.join(SPOOL_DIR, call_name)
+    spool_fd  = _spool_dir_fd()
+
+    content = _CALL_TPL.format(to=to, sound_name=sound_name)
+    fd = os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o640, dir_fd=spool_fd)
+    try:
+        os.write(fd, content.encode())
+        _chown_asterisk(fd)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    os.replace(tmp_name, call_name, src_dir_fd=spool_fd, dst_dir_fd=spool_fd)
+    os.fsync(spool_fd)
 
     return {"status": "ok", "to": to, "sound": sound_name, "call_file": call_file}
 
@@ -105,24 +386,56 @@ def _cleanup_old_sounds():
     """Remove TTS WAV files older than MAX_SOUND_AGE_SECS."""
     now = time.time()
     try:
-        for f in os.listdir(SOUNDS_DIR):
-            if f.startswith("akira-alert-"):
-                path = os.path.join(SOUNDS_DIR, f)
-                if os.path.isfile(path) and (now - os.path.getmtime(path)) > MAX_SOUND_AGE_SECS:
-                    os.remove(path)
+        # scandir: is_file() comes from d_type, so each entry costs one stat at most
+        with os.scandir(SOUNDS_DIR) as it:
+            for e in it:
+                if (e.name.startswith("akira-alert-")
+                        and e.name[:-len(".wav")] not in _pinned_sounds
+                        and e.is_file(follow_symlinks=False)
+                        and (now - e.stat(follow_symlinks=False).st_mtime) > MAX_SOUND_AGE_SECS):
+                    os.unlink(e.path)
     except Exception:
         pass
 
 
+def _precache_sounds():
+    """Render PRECACHE_MESSAGES up front so templated alerts hit the TTS cache
+    on their very first call."""
+    done = 0
+    for message in PRECACHE_MESSAGES:
+        try:
+            _pinned_sounds.add(generate_tts(message))
+            done += 1
+        except Exception as e:
+            print(f"[ami-relay] precache failed for {message!r}: {e}", file=sys.stderr, flush=True)
+    print(f"[ami-relay] Precached {done}/{len(PRECACHE_MESSAGES)} alert sounds", flush=True)
+
+
+def _cleanup_loop():
+    """Background sweeper: runs _cleanup_old_sounds every CLEANUP_INTERVAL_SECS,
+    keeping the directory scan off the request path."""
+    while True:
+        _cleanup_old_sounds()
+        time.sleep(CLEANUP_INTERVAL_SECS)
+
+
 class Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so call_phone can keep its connection open between alerts.
+    # Every response carries Content-Length (send_error adds it itself).
+    protocol_version = "HTTP/1.1"
+    # Close kept-alive sockets idle this long, so a peer that vanished without
+    # a FIN doesn't pin a handler thread forever. call_phone reconnects.
+    timeout = 60
+
     def do_GET(self):
         if self.path == "/health":
-            self._json(200, {"status": "ok"})
+            self.log_request(200)
+            self.wfile.write(_HEALTH_RESPONSE)
         else:
             self.send_error(404)
 
     def do_POST(self):
-        if self.path != "/call":
+        if self.path not in ("/call", "/call_batch"):
             self.send_error(404)
             return
 
@@ -130,26 +443,55 @@ class Handler(BaseHTTPRequestHandler):
             self.send_error(500, "FREEPBX_RELAY_TOKEN not set")
             return
 
-        if self.headers.get("X-Relay-Token") != RELAY_TOKEN:
+        # Constant-time compare so response timing doesn't leak the token.
+        token = self.headers.get("X-Relay-Token", "")
+        if not hmac.compare_digest(token.encode(), RELAY_TOKEN.encode()):
             self.send_error(403, "Forbidden")
             return
 
-        length = int(self.headers.get("Content-Length", 0))
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.send_error(400, "Invalid Content-Length")
+            return
+        if length > MAX_BODY_BYTES:
+            self.send_error(413, "Request body too large")
+            return
+
         try:
             body = json.loads(self.rfile.read(length))
         except Exception:
             self.send_error(400, "Invalid JSON")
             return
+        if not isinstance(body, dict):
+            self.send_error(400, "Invalid JSON")
+            return
 
-        to      = str(body.get("to", "")).strip()
-        message = str(body.get("message", "Alert from Akira")).strip()
-
+        to = str(body.get("to", "")).strip()
         if not to:
             self.send_error(400, "Missing 'to'")
             return
 
+        if self.path == "/call_batch":
+            # One call for an alert storm: the messages are spoken back to back
+            # from a single (cached) TTS render and a single call file.
+            messages = body.get("messages")
+            if not isinstance(messages, list):
+                self.send_error(400, "Missing 'messages'")
+                return
+            parts = [str(m).strip().rstrip(".") for m in messages]
+            parts = [p for p in parts if p]
+            if not parts:
+                self.send_error(400, "Missing 'messages'")
+                return
+            message = ". ".join(parts) + "."
+        else:
+            message = str(body.get("message", "Alert from Akira")).strip()
+
         try:
-            result = originate_call(to, message)
+            result = originate_call(to, message, self.headers.get("Idempotency-Key", "").strip())
             self._json(200, result)
         except Exception as e:
             self._json(500, {"status": "error", "reason": str(e)})
@@ -170,6 +512,15 @@ if __name__ == "__main__":
     if not RELAY_TOKEN:
         print("[ami-relay] ERROR: FREEPBX_RELAY_TOKEN environment variable not set", file=sys.stderr)
         sys.exit(1)
+    print(f"[ami-relay] TTS engine: {'libflite (in-process)' if _FLITE else 'flite binary'}, "
+          f"resampler: {'audioop' if audioop else 'sox'}", flush=True)
+    threading.Thread(target=_cleanup_loop, name="sound-cleanup", daemon=True).start()
+    if PRECACHE_MESSAGES:
+        # Concurrent /calls for a message still being rendered wait on its TTS lock.
+        threading.Thread(target=_precache_sounds, name="sound-precache", daemon=True).start()
     print(f"[ami-relay] Listening on 0.0.0.0:{RELAY_PORT}", flush=True)
-    server = HTTPServer(("0.0.0.0", RELAY_PORT), Handler)
+    # One thread per request: a /call blocked in flite + sox no longer stalls
+    # /health or other calls.
+    server = ThreadingHTTPServer(("0.0.0.0", RELAY_PORT), Handler)
+    server.daemon_threads = True
     server.serve_forever()
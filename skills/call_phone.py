@@ -20,20 +20,68 @@ Environment variables (set in docker-compose.yml or .env):
     OWNER_PHONE          — default call destination in E.164 format (e.g. +15551234567)
 
 Returns JSON:
-    {"status": "ok",  "to": "+E164...", "sound": "akira-alert-NNN"}   ← success
+    {"status": "ok",  "to": "+E164...", "sound": "akira-alert-<hash>"} ← success
     {"status": "error", "reason": "..."}                               ← failure
 """
 
+import http.client
 import json
 import os
 import sys
-import urllib.request
-import urllib.error
+import threading
+import urllib.parse
 
 RELAY_URL   = os.environ.get("FREEPBX_RELAY_URL",   "")
 RELAY_TOKEN = os.environ.get("FREEPBX_RELAY_TOKEN", "")
 OWNER_PHONE = os.environ.get("OWNER_PHONE",          "")
 
+try:
+    # orjson, if the container image has it; stdlib json otherwise.
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# One keep-alive connection to the relay, reused across calls so an alert
+# storm pays a single TCP handshake. Guarded by a lock — http.client
+# connections are not thread-safe.
+_conn      = None
+_conn_lock = threading.Lock()
+
+
+def _post(path: str, payload: bytes) -> tuple:
+    """POST `payload` to the relay over the shared connection.
+    Returns (status, reason, body). Reconnects once if the kept-alive
+    socket was closed by the relay while idle."""
+    global _conn
+    url = urllib.parse.urlsplit(RELAY_URL)
+    headers = {
+        "Content-Type": "application/json",
+        "X-Relay-Token": RELAY_TOKEN,
+    }
+    with _conn_lock:
+        for attempt in range(2):
+            if _conn is None:
+                cls = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+                _conn = cls(url.hostname, url.port, timeout=15)
+            try:
+                _conn.request("POST", url.path.rstrip("/") + path, body=payload, headers=headers)
+                resp = _conn.getresponse()
+                return resp.status, resp.reason, resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                _conn.close()
+                _conn = None
+                if attempt:
+                    raise
+            except Exception:
+                _conn.close()
+                _conn = None
+                raise
+
 
 def call_phone(message: str, to: str = OWNER_PHONE) -> dict:
     """
@@ -53,22 +101,15 @@ def call_phone(message: str, to: str = OWNER_PHONE) -> dict:
     if not to:
         return {"status": "error", "reason": "No destination phone number — set OWNER_PHONE or pass 'to'"}
 
-    payload = json.dumps({"to": to, "message": message}).encode()
-    req = urllib.request.Request(
-        f"{RELAY_URL}/call",
-        data=payload,
-        headers={
-            "Content-Type": "application/json",
-            "X-Relay-Token": RELAY_TOKEN,
-        },
-        method="POST",
-    )
+    payload = _dumps({"to": to, "message": message})
+    try:
+        status, reason, body = _post("/call", payload)
+    except Exception as e:
+        return {"status": "error", "reason": str(e)}
+    if status >= 400:
+        return {"status": "error", "code": status, "reason": f"{reason}: {body.decode(errors='replace')}"}
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            return json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        body = e.read().decode(errors="replace")
-        return {"status": "error", "code": e.code, "reason": f"{e.reason}: {body}"}
+        return _loads(body)
     except Exception as e:
         return {"status": "error", "reason": str(e)}
 